@@ -1,5 +1,7 @@
 import time
+import signal
 import typing
+import threading
 import bittensor as bt
 
 import template
@@ -41,16 +43,13 @@ class Miner(BaseMinerNeuron):
             bt.logging.warning("Received a request without a dendrite or hotkey.")
             return True, "Missing dendrite or hotkey"
 
-        uid = self.metagraph.hotkeys.index(synapse.dendrite.hotkey)
-        if (
-            not self.config.blacklist.allow_non_registered
-            and synapse.dendrite.hotkey not in self.metagraph.hotkeys
-        ):
+        uid = self._hotkey_to_uid.get(synapse.dendrite.hotkey)
+        if not self.config.blacklist.allow_non_registered and uid is None:
             bt.logging.trace(f"Blacklisting un-registered hotkey {synapse.dendrite.hotkey}")
             return True, "Unrecognized hotkey"
 
         if self.config.blacklist.force_validator_permit:
-            if not self.metagraph.validator_permit[uid]:
+            if uid is None or not self.metagraph.validator_permit[uid]:
                 bt.logging.warning(f"Blacklisting non-validator hotkey {synapse.dendrite.hotkey}")
                 return True, "Non-validator hotkey"
 
@@ -62,7 +61,9 @@ class Miner(BaseMinerNeuron):
             bt.logging.warning("Received a request without a dendrite or hotkey.")
             return 0.0
 
-        caller_uid = self.metagraph.hotkeys.index(synapse.dendrite.hotkey)
+        caller_uid = self._hotkey_to_uid.get(synapse.dendrite.hotkey)
+        if caller_uid is None:
+            return 0.0
         priority = float(self.metagraph.S[caller_uid])
         bt.logging.trace(f"Prioritizing {synapse.dendrite.hotkey} with value: {priority}")
         return priority
@@ -70,6 +71,12 @@ class Miner(BaseMinerNeuron):
 
 if __name__ == "__main__":
     with Miner() as miner:
-        while True:
-            bt.logging.info(f"Miner running... {time.time()}")
-            time.sleep(5)
+        # Installed only after startup so Ctrl-C can still abort a hung
+        # subtensor connection or registration check.
+        stop = threading.Event()
+        signal.signal(signal.SIGINT, lambda *_: stop.set())
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
+        # Block on the event instead of polling; log a heartbeat once a minute.
+        while not stop.wait(60):
+            bt.logging.debug(f"Miner running... {time.time()}")
@@ -26,7 +26,7 @@ import bittensor as bt
 from template.base.neuron import BaseNeuron
 from template.utils.config import add_miner_args
 
-from typing import Union
+from typing import Dict, Union
 
 
 class BaseMinerNeuron(BaseNeuron):
@@ -74,6 +74,10 @@ class BaseMinerNeuron(BaseNeuron):
         self.thread: Union[threading.Thread, None] = None
         self.lock = asyncio.Lock()
 
+        # Hotkey -> uid lookup for blacklist/priority, rebuilt on every metagraph sync.
+        self._hotkey_to_uid: Dict[str, int] = {}
+        self._refresh_hotkey_map()
+
     def run(self):
         """
         Initiates and manages the main loop for the miner on the Bittensor network. The main loop handles graceful shutdown on keyboard interrupts and logs unforeseen errors.
@@ -194,3 +198,10 @@ class BaseMinerNeuron(BaseNeuron):
 
         # Sync the metagraph.
         self.metagraph.sync(subtensor=self.subtensor)
+        self._refresh_hotkey_map()
+
+    def _refresh_hotkey_map(self):
+        """Rebuilds the hotkey -> uid map so request handlers avoid a linear scan of the metagraph."""
+        self._hotkey_to_uid = {
+            hotkey: uid for uid, hotkey in enumerate(self.metagraph.hotkeys)
+        }
@@ -1,12 +1,17 @@
-import json
+import orjson
 from pathlib import Path
 from typing import List, Dict
 
 
+_DUMP_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+# 1 MiB write buffer so large outputs flush in a handful of syscalls
+_WRITE_BUFFER = 1 << 20
+
+
 class ReviewDataPreprocessor:
     """
     Takes flat review list from OpenReviewScraper and splits it into
-    per-miner JSON files + paper metadata for the validator.
+    per-miner JSONL files + paper metadata for the validator.
     """
 
     def __init__(self, reviews: List[Dict]):
@@ -14,8 +19,8 @@ class ReviewDataPreprocessor:
 
     @classmethod
     def from_json(cls, path: str) -> "ReviewDataPreprocessor":
-        with open(path, "r", encoding="utf-8") as f:
-            return cls(json.load(f))
+        with open(path, "rb") as f:
+            return cls(orjson.loads(f.read()))
 
     def process(self, output_dir: str, num_miners: int = 5):
         out = Path(output_dir)
@@ -33,18 +38,18 @@ class ReviewDataPreprocessor:
                 }
 
         # Round-robin assign reviews to miners
-        miner_buckets: List[List[Dict]] = [[] for _ in range(num_miners)]
-        for i, r in enumerate(self.reviews):
-            miner_buckets[i % num_miners].append(r)
+        miner_buckets: List[List[Dict]] = [
+            self.reviews[mid::num_miners] for mid in range(num_miners)
+        ]
 
-        # Write per-miner files
+        # Write per-miner files, one review per line
         for mid, bucket in enumerate(miner_buckets):
-            with open(out / f"miner_{mid}_reviews.json", "w", encoding="utf-8") as f:
-                json.dump(bucket, f, indent=2, ensure_ascii=False)
+            with open(out / f"miner_{mid}_reviews.jsonl", "wb", buffering=_WRITE_BUFFER) as f:
+                f.writelines(orjson.dumps(r) + b"\n" for r in bucket)
 
         # Write paper metadata
-        with open(out / "paper_metadata.json", "w", encoding="utf-8") as f:
-            json.dump(paper_metadata, f, indent=2, ensure_ascii=False)
+        with open(out / "paper_metadata.json", "wb", buffering=_WRITE_BUFFER) as f:
+            f.write(orjson.dumps(paper_metadata, option=_DUMP_OPTS))
 
         # Write summary
         summary = {
@@ -53,8 +58,8 @@ class ReviewDataPreprocessor:
             "total_papers": len(paper_metadata),
             "reviews_per_miner": [len(b) for b in miner_buckets],
         }
-        with open(out / "miner_assignments.json", "w", encoding="utf-8") as f:
-            json.dump(summary, f, indent=2)
+        with open(out / "miner_assignments.json", "wb", buffering=_WRITE_BUFFER) as f:
+            f.write(orjson.dumps(summary, option=_DUMP_OPTS))
 
         print(f"Processed {len(self.reviews)} reviews across {len(paper_metadata)} papers for {num_miners} miners")
         print(f"Output: {out}")
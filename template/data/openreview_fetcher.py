@@ -1,17 +1,37 @@
 import openreview
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence
 import textwrap
 
 
+_REVIEW_KEYS = ("review", "comments_to_authors", "main_review", "comments")
+_SUMMARY_KEYS = ("summary", "summary_of_the_paper", "paper_summary")
+_STRENGTHS_KEYS = ("strengths", "pros", "strong_points")
+_WEAKNESSES_KEYS = ("weaknesses", "cons", "weak_points")
+_QUESTIONS_KEYS = ("questions", "questions_for_authors")
+_LIMITATIONS_KEYS = ("limitations",)
+_RATING_KEYS = ("rating", "recommendation", "score", "overall_rating")
+
+_SECTION_FIELDS = (
+    ("summary", _SUMMARY_KEYS),
+    ("strengths", _STRENGTHS_KEYS),
+    ("weaknesses", _WEAKNESSES_KEYS),
+    ("questions", _QUESTIONS_KEYS),
+    ("limitations", _LIMITATIONS_KEYS),
+)
+
+_OFFICIAL_REVIEW_SUFFIX = "/-/Official_Review"
+
+
 class OpenReviewScraper:
     def __init__(self, venue: str = "ICLR.cc/2023/Conference"):
         self.venue = venue
         self.client = openreview.Client(baseurl="https://api.openreview.net")
 
     @staticmethod
-    def pick(content: Dict, keys: List[str]) -> str:
+    def pick(content: Dict, keys: Sequence[str]) -> str:
         content = content or {}
         for k in keys:
             v = content.get(k, "")
@@ -30,34 +50,35 @@ class OpenReviewScraper:
         notes = getattr(resp, "notes", None)
         return notes if isinstance(notes, list) else []
 
-    def build_review_text(self, content: Dict) -> str:
-        direct_review = self.pick(
-            content,
-            [
-                "review",
-                "comments_to_authors",
-                "main_review",
-                "comments",
-            ],
+    @staticmethod
+    def _join_sections(sections: Dict[str, str]) -> str:
+        return "\n\n".join(
+            f"{label.capitalize()}:\n{value}"
+            for label, value in sections.items()
+            if value
         )
+
+    def build_review_text(self, content: Dict) -> str:
+        direct_review = self.pick(content, _REVIEW_KEYS)
         if direct_review:
             return direct_review
 
-        sections = []
-        field_map = [
-            ("summary", ["summary", "summary_of_the_paper", "paper_summary"]),
-            ("strengths", ["strengths", "pros", "strong_points"]),
-            ("weaknesses", ["weaknesses", "cons", "weak_points"]),
-            ("questions", ["questions", "questions_for_authors"]),
-            ("limitations", ["limitations"]),
-        ]
-
-        for label, keys in field_map:
-            value = self.pick(content, keys)
-            if value:
-                sections.append(f"{label.capitalize()}:\n{value}")
+        return self._join_sections({
+            label: self.pick(content, keys) for label, keys in _SECTION_FIELDS
+        })
 
-        return "\n\n".join(sections)
+    def _extract(self, rc: Dict) -> Dict[str, str]:
+        # Pick every section once and reuse it for both the fields and the fallback text
+        rc = rc or {}
+        pick = self.pick
+        sections = {label: pick(rc, keys) for label, keys in _SECTION_FIELDS}
+        return {
+            "review_text": pick(rc, _REVIEW_KEYS) or self._join_sections(sections),
+            "summary": sections["summary"],
+            "strengths": sections["strengths"],
+            "weaknesses": sections["weaknesses"],
+            "rating": pick(rc, _RATING_KEYS),
+        }
 
     def _get_some_submissions(self, limit: int = 50) -> List[Any]:
         candidates = [
@@ -89,47 +110,50 @@ class OpenReviewScraper:
             "Could not fetch submissions with common invitations."
         )
 
-    def scrape_reviews(self, paper_limit: int = 50) -> List[Dict]:
-        submissions = self._get_some_submissions(limit=paper_limit)
-        print(f"Fetched {len(submissions)} submissions (testing)")
+    def _fetch_reviews_for(self, sub: Any) -> List[Dict]:
+        paper_id = getattr(sub, "id", None)
+        if not paper_id:
+            return []
 
-        dataset: List[Dict] = []
+        sub_content = getattr(sub, "content", {}) or {}
+        title = self.pick(sub_content, ["title"])
+        abstract = self.pick(sub_content, ["abstract"])
+
+        try:
+            forum_notes = self.client.get_notes(forum=paper_id)
+            forum_notes = self._notes_list(forum_notes)
+        except Exception:
+            return []
 
-        for idx, sub in enumerate(submissions, 1):
-            paper_id = getattr(sub, "id", None)
-            if not paper_id:
+        rows: List[Dict] = []
+        extract = self._extract
+        for n in forum_notes:
+            inv = getattr(n, "invitation", "") or ""
+            if not inv.endswith(_OFFICIAL_REVIEW_SUFFIX):
                 continue
 
-            sub_content = getattr(sub, "content", {}) or {}
-            title = self.pick(sub_content, ["title"])
-            abstract = self.pick(sub_content, ["abstract"])
+            rows.append({
+                "paper_id": paper_id,
+                "review_id": getattr(n, "id", None),
+                "title": title,
+                "abstract": abstract,
+                **extract(getattr(n, "content", None)),
+            })
+        return rows
 
-            try:
-                forum_notes = self.client.get_notes(forum=paper_id)
-                forum_notes = self._notes_list(forum_notes)
-            except Exception:
-                continue
+    def scrape_reviews(self, paper_limit: int = 50, max_workers: int = 16) -> List[Dict]:
+        submissions = self._get_some_submissions(limit=paper_limit)
+        print(f"Fetched {len(submissions)} submissions (testing)")
+
+        dataset: List[Dict] = []
+
+        # Forum fetches are independent HTTP round-trips, so overlap them
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            for idx, rows in enumerate(ex.map(self._fetch_reviews_for, submissions), 1):
+                dataset.extend(rows)
 
-            for n in forum_notes:
-                inv = getattr(n, "invitation", "") or ""
-                if not inv.endswith("/-/Official_Review"):
-                    continue
-
-                rc = getattr(n, "content", {}) or {}
-                dataset.append({
-                    "paper_id": paper_id,
-                    "review_id": getattr(n, "id", None),
-                    "title": title,
-                    "abstract": abstract,
-                    "review_text": self.build_review_text(rc),
-                    "summary": self.pick(rc, ["summary", "summary_of_the_paper", "paper_summary"]),
-                    "strengths": self.pick(rc, ["strengths", "pros", "strong_points"]),
-                    "weaknesses": self.pick(rc, ["weaknesses", "cons", "weak_points"]),
-                    "rating": self.pick(rc, ["rating", "recommendation", "score", "overall_rating"]),
-                })
-
-            if idx % 10 == 0:
-                print(f"Processed {idx}/{len(submissions)} papers... rows={len(dataset)}")
+                if idx % 10 == 0:
+                    print(f"Processed {idx}/{len(submissions)} papers... rows={len(dataset)}")
 
         return dataset
 
@@ -1,6 +1,6 @@
-import json
+import orjson
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, Iterable, Iterator, List
 
 
 class ReviewDataset:
@@ -10,28 +10,62 @@ class ReviewDataset:
         self.miner_id = miner_id
         self.current_index = 0
 
+        # Column-wise storage: one list per field plus a paper_id -> row index
+        self.paper_ids: List[str] = []
+        self.review_texts: List[str] = []
+        self.titles: List[str] = []
+        self.ratings: List[str] = []
+        self._pid_to_idx: Dict[str, int] = {}
+
+        jsonl_file = self.data_path / f"miner_{miner_id}_reviews.jsonl"
         review_file = self.data_path / f"miner_{miner_id}_reviews.json"
 
-        if not review_file.exists():
-            print(f"Warning: {review_file} not found. Run data preprocessing first.")
-            self.reviews: List[Dict] = []
+        if jsonl_file.exists():
+            self._load(self._iter_jsonl(jsonl_file))
+            print(f"Miner {miner_id}: loaded {len(self)} reviews")
+        elif review_file.exists():
+            with open(review_file, "rb") as f:
+                self._load(orjson.loads(f.read()))
+            print(f"Miner {miner_id}: loaded {len(self)} reviews")
         else:
-            with open(review_file, "r", encoding="utf-8") as f:
-                self.reviews = json.load(f)
-            print(f"Miner {miner_id}: loaded {len(self.reviews)} reviews")
+            print(f"Warning: {jsonl_file} not found. Run data preprocessing first.")
+
+    @staticmethod
+    def _iter_jsonl(path: Path) -> Iterator[Dict]:
+        # One record per line, so we never hold the whole file as a single buffer
+        with open(path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line)
+
+    def _load(self, reviews: Iterable[Dict]):
+        for r in reviews:
+            pid = r["paper_id"]
+            # First review for a paper wins, matching the old linear scan
+            self._pid_to_idx.setdefault(pid, len(self.paper_ids))
+            self.paper_ids.append(pid)
+            self.review_texts.append(r.get("review_text", ""))
+            self.titles.append(r.get("title", ""))
+            self.ratings.append(r.get("rating", ""))
+
+    def _row(self, i: int) -> Dict:
+        return {
+            "paper_id": self.paper_ids[i],
+            "review_text": self.review_texts[i],
+            "title": self.titles[i],
+            "rating": self.ratings[i],
+        }
 
     def get_next(self) -> Optional[Dict]:
-        if not self.reviews:
+        if not self.paper_ids:
             return None
-        review = self.reviews[self.current_index]
-        self.current_index = (self.current_index + 1) % len(self.reviews)
+        review = self._row(self.current_index)
+        self.current_index = (self.current_index + 1) % len(self.paper_ids)
         return review
 
     def get_review_for_paper(self, paper_id: str) -> Optional[Dict]:
-        for review in self.reviews:
-            if review["paper_id"] == paper_id:
-                return review
-        return None
+        i = self._pid_to_idx.get(paper_id)
+        return None if i is None else self._row(i)
 
     def __len__(self) -> int:
-        return len(self.reviews)
+        return len(self.paper_ids)
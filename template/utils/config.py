@@ -229,6 +229,13 @@ def add_validator_args(cls, parser):
         default="gpt-4.1-mini",
     )
 
+    parser.add_argument(
+        "--llm_concurrency",
+        type=int,
+        help="Maximum number of in-flight OpenAI scoring requests.",
+        default=16,
+    )
+
     parser.add_argument(
         "--neuron.disable_set_weights",
         action="store_true",
@@ -1,6 +1,9 @@
-import json
+import asyncio
 import hashlib
+import sqlite3
+import orjson
 import numpy as np
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import bittensor as bt
@@ -61,6 +64,12 @@ Return your evaluation as JSON with this exact structure:
 
 Be rigorous. Most reviews should score 2-3. Scores of 5 are rare and must be earned."""
 
+_SYSTEM_MSG = {"role": "system", "content": RUBRIC_SYSTEM_PROMPT}
+
+# Only this much of each input is sent to the LLM (and therefore hashed)
+MAX_ABSTRACT_CHARS = 1000
+MAX_REVIEW_CHARS = 3000
+
 
 CRITERIA = [
     "comprehension",
@@ -80,6 +89,20 @@ CRITERIA_WEIGHTS = {
     "professionalism": 0.05,
 }
 
+# Weights pre-scaled to the 0-100 aggregate range, in CRITERIA order
+_WEIGHTS_VEC = np.array(
+    [CRITERIA_WEIGHTS[c] for c in CRITERIA], dtype=np.float64
+) * 20.0
+
+# exp(-0.5 * rank) for the ranks a paper realistically sees
+_DECAY_LUT = np.exp(-0.5 * np.arange(64, dtype=np.float64))
+
+
+def _rank_decay(ranks: np.ndarray) -> np.ndarray:
+    if ranks.size and ranks.max() >= _DECAY_LUT.size:
+        return np.exp(-0.5 * ranks)
+    return _DECAY_LUT[ranks]
+
 
 class LLMReviewScorer:
 
@@ -89,6 +112,8 @@ class LLMReviewScorer:
         api_key: Optional[str] = None,
         cache_dir: str = "data/cache",
         temperature: float = 0.0,
+        concurrency: int = 16,
+        mem_cache_size: int = 4096,
     ):
         if AsyncOpenAI is None:
             raise ImportError("openai not installed. Run: pip install openai")
@@ -96,27 +121,89 @@ class LLMReviewScorer:
         self.model = model
         self.temperature = temperature
         self.client = AsyncOpenAI(api_key=api_key)
+        self._key_prefix = self.model.encode() + b"|"
+        # Caps in-flight OpenAI requests so batched scoring stays under rate limits
+        self._semaphore = asyncio.Semaphore(concurrency)
 
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        # All cached scores live in one SQLite file keyed by cache key. WAL with
+        # synchronous=NORMAL avoids an fsync per commit, and the short timeout
+        # bounds how long another process holding the lock can stall the loop.
+        self._db = sqlite3.connect(
+            str(self.cache_dir / "scores.sqlite3"),
+            timeout=1.0,
+            check_same_thread=False,
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS scores (key TEXT PRIMARY KEY, data BLOB NOT NULL)"
+        )
+        self._db.commit()
+
+        # In-process LRU in front of the on-disk cache
+        self._mem_cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self._mem_cache_cap = mem_cache_size
+        # New scores waiting to be written to SQLite by flush_cache()
+        self._pending_writes: List[Tuple[str, bytes]] = []
+
         bt.logging.info(f"Initialized LLM scorer with model: {model}")
 
     def _cache_key(self, paper_abstract: str, review_text: str) -> str:
-        content = f"{self.model}|{paper_abstract}|{review_text}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        # Key on the truncated text so it matches what the API actually sees
+        h = hashlib.blake2b(self._key_prefix, digest_size=16)
+        h.update(paper_abstract[:MAX_ABSTRACT_CHARS].encode())
+        h.update(b"|")
+        h.update(review_text[:MAX_REVIEW_CHARS].encode())
+        return h.hexdigest()
+
+    def _remember(self, cache_key: str, score_data: Dict):
+        # Store and hand out shallow copies so callers mutating a score
+        # (e.g. via synapse.review_score) can never corrupt later hits
+        self._mem_cache[cache_key] = dict(score_data)
+        self._mem_cache.move_to_end(cache_key)
+        if len(self._mem_cache) > self._mem_cache_cap:
+            self._mem_cache.popitem(last=False)
 
     def _get_cached(self, cache_key: str) -> Optional[Dict]:
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        if cache_file.exists():
-            with open(cache_file, "r") as f:
-                return json.load(f)
-        return None
+        cached = self._mem_cache.get(cache_key)
+        if cached is not None:
+            self._mem_cache.move_to_end(cache_key)
+            return dict(cached)
+
+        try:
+            row = self._db.execute(
+                "SELECT data FROM scores WHERE key = ?", (cache_key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            bt.logging.warning(f"Score cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        cached = orjson.loads(row[0])
+        self._remember(cache_key, cached)
+        return cached
 
     def _save_cache(self, cache_key: str, score_data: Dict):
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        with open(cache_file, "w") as f:
-            json.dump(score_data, f, indent=2)
+        self._remember(cache_key, score_data)
+        self._pending_writes.append((cache_key, orjson.dumps(score_data)))
+
+    def flush_cache(self):
+        """Writes queued scores to SQLite in a single transaction."""
+        if not self._pending_writes:
+            return
+        pending, self._pending_writes = self._pending_writes, []
+        try:
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO scores (key, data) VALUES (?, ?)",
+                    pending,
+                )
+        except sqlite3.Error as e:
+            # Scores are still served from memory; only persistence is lost
+            bt.logging.warning(f"Failed to persist {len(pending)} cached scores: {e}")
 
     async def score_review(
         self,
@@ -124,6 +211,9 @@ class LLMReviewScorer:
         review_text: str,
         use_cache: bool = True,
     ) -> Dict:
+        paper_abstract = paper_abstract[:MAX_ABSTRACT_CHARS]
+        review_text = review_text[:MAX_REVIEW_CHARS]
+
         if use_cache:
             cache_key = self._cache_key(paper_abstract, review_text)
             cached = self._get_cached(cache_key)
@@ -132,29 +222,25 @@ class LLMReviewScorer:
                 return cached
 
         user_prompt = (
-            f"Paper Abstract:\n{paper_abstract[:1000]}\n\n"
-            f"Review to Evaluate:\n{review_text[:3000]}\n\n"
+            f"Paper Abstract:\n{paper_abstract}\n\n"
+            f"Review to Evaluate:\n{review_text}\n\n"
             f"Evaluate this review using the rubric."
         )
 
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": RUBRIC_SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=self.temperature,
-                response_format={"type": "json_object"},
-            )
-            result = json.loads(response.choices[0].message.content)
+            async with self._semaphore:
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        _SYSTEM_MSG,
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    temperature=self.temperature,
+                    response_format={"type": "json_object"},
+                    logprobs=False,
+                )
+            result = orjson.loads(response.choices[0].message.content)
             score_data = self._validate_and_aggregate(result)
-
-            if use_cache:
-                self._save_cache(cache_key, score_data)
-
-            return score_data
-
         except Exception as e:
             bt.logging.error(f"Error scoring review: {e}")
             return {
@@ -166,6 +252,10 @@ class LLMReviewScorer:
                 "error": str(e),
             }
 
+        if use_cache:
+            self._save_cache(cache_key, score_data)
+        return score_data
+
     def _validate_and_aggregate(self, result: Dict) -> Dict:
         for criterion in CRITERIA:
             if criterion not in result:
@@ -178,11 +268,10 @@ class LLMReviewScorer:
         else:
             result["confidence"] = max(0.0, min(1.0, float(result["confidence"])))
 
-        aggregate = sum(
-            result[criterion] * CRITERIA_WEIGHTS[criterion] * 20
-            for criterion in CRITERIA
+        vals = np.fromiter(
+            (result[c] for c in CRITERIA), dtype=np.float64, count=len(CRITERIA)
         )
-        result["aggregate_score"] = aggregate
+        result["aggregate_score"] = float(vals @ _WEIGHTS_VEC)
 
         return result
 
@@ -190,20 +279,36 @@ class LLMReviewScorer:
         self,
         paper_abstract: str,
         reviews: List[Dict],
+        inflight: Optional[Dict[str, "asyncio.Future"]] = None,
+        use_cache: bool = True,
     ) -> List[Dict]:
-        scores = []
-        for review in reviews:
+        async def _score(review: Dict) -> Dict:
             review_text = review.get("review_text", "")
             if not review_text:
                 bt.logging.warning("Empty review text, assigning zero score")
-                scores.append({
+                return {
                     "aggregate_score": 0.0,
                     "confidence": 0.0,
                     "error": "Empty review",
-                })
-                continue
-            score = await self.score_review(paper_abstract, review_text)
-            scores.append(score)
+                }
+            if inflight is None:
+                return await self.score_review(paper_abstract, review_text, use_cache)
+
+            # Identical (abstract, review) pairs in a batch share one LLM call
+            key = self._cache_key(paper_abstract, review_text)
+            task = inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(
+                    self.score_review(paper_abstract, review_text, use_cache)
+                )
+                inflight[key] = task
+            # Each duplicate gets its own copy of the shared result
+            return dict(await task)
+
+        scores = list(await asyncio.gather(*[_score(r) for r in reviews]))
+        if inflight is None:
+            # Batched callers share inflight and flush once after their own gather
+            self.flush_cache()
         return scores
 
 
@@ -213,14 +318,19 @@ async def score_reviews_grouped(
     query_uids: Optional[List[int]] = None,
 ) -> Tuple[np.ndarray, List[int]]:
     model = getattr(validator.config, "llm_model", "gpt-4.1-mini")
-    scorer = LLMReviewScorer(model=model)
+    # Reuse the scorer across forward passes to keep the HTTP pool and caches warm
+    scorer = getattr(validator, "_llm_scorer", None)
+    if scorer is None or scorer.model != model:
+        concurrency = getattr(validator.config, "llm_concurrency", 16)
+        scorer = LLMReviewScorer(model=model, concurrency=concurrency)
+        validator._llm_scorer = scorer
 
     data_path = getattr(validator.config, "data_path", "data/processed")
     metadata_file = Path(data_path) / "paper_metadata.json"
 
     if metadata_file.exists():
-        with open(metadata_file, "r") as f:
-            paper_metadata = json.load(f)
+        with open(metadata_file, "rb") as f:
+            paper_metadata = orjson.loads(f.read())
     else:
         paper_metadata = {}
         bt.logging.warning("No paper metadata found, using empty abstracts")
@@ -245,36 +355,74 @@ async def score_reviews_grouped(
         scored_uids = list(query_uids)
         query_uid_to_index = {uid: i for i, uid in enumerate(query_uids)}
 
-    for paper_id, paper_reviews in reviews_by_paper.items():
+    paper_abstracts: Dict[str, str] = {}
+    paper_cacheable: Dict[str, bool] = {}
+    for paper_id in reviews_by_paper:
         paper_info = paper_metadata.get(paper_id, {})
         abstract = paper_info.get("abstract", "")
 
+        # Title-only fallbacks are not cached, so fixed metadata is rescored
+        paper_cacheable[paper_id] = bool(abstract)
         if not abstract:
             bt.logging.warning(f"No abstract for paper {paper_id}, using title only")
             abstract = paper_info.get("title", "Unknown paper")
-
-        scores = await scorer.score_reviews_for_paper(abstract, paper_reviews)
-
-        ranked_indices = np.argsort(
-            [s["aggregate_score"] for s in scores]
-        )[::-1]
-
-        for rank, idx in enumerate(ranked_indices):
-            miner_uid = paper_reviews[idx]["miner_uid"]
-            base_score = scores[idx]["aggregate_score"]
-            confidence = scores[idx].get("confidence", 1.0)
-
-            reward = base_score * np.exp(-0.5 * rank) * confidence
-            if query_uids is None:
-                all_rewards[miner_uid] = reward
-            else:
-                query_index = query_uid_to_index[miner_uid]
-                all_rewards[query_index] = reward
-
-            paper_reviews[idx]["synapse"].review_score = scores[idx]
-            paper_reviews[idx]["synapse"].final_score = reward
-
-    if all_rewards.max() > 0:
-        all_rewards = all_rewards / all_rewards.max()
+        paper_abstracts[paper_id] = abstract
+
+    # Score every paper concurrently; the scorer's semaphore bounds the fan-out
+    inflight: Dict[str, asyncio.Future] = {}
+    paper_scores = await asyncio.gather(*[
+        scorer.score_reviews_for_paper(
+            paper_abstracts[paper_id],
+            paper_reviews,
+            inflight=inflight,
+            use_cache=paper_cacheable[paper_id],
+        )
+        for paper_id, paper_reviews in reviews_by_paper.items()
+    ])
+    scorer.flush_cache()
+
+    slots: List[int] = []
+    bases: List[np.ndarray] = []
+    ranks: List[np.ndarray] = []
+    confs: List[np.ndarray] = []
+    scored_reviews: List[Tuple[Dict, Dict]] = []
+
+    for paper_reviews, scores in zip(reviews_by_paper.values(), paper_scores):
+        k = len(scores)
+        scores_arr = np.fromiter(
+            (s["aggregate_score"] for s in scores), dtype=np.float64, count=k
+        )
+        # Rank 0 is the best review for this paper. Ties go to the later
+        # submission (reversed stable sort), as the original ranking did.
+        ranked = np.argsort(scores_arr, kind="stable")[::-1]
+        ranks_of = np.empty_like(ranked)
+        ranks_of[ranked] = np.arange(k)
+
+        bases.append(scores_arr)
+        ranks.append(ranks_of)
+        confs.append(np.fromiter(
+            (s.get("confidence", 1.0) for s in scores), dtype=np.float64, count=k
+        ))
+        for review, score in zip(paper_reviews, scores):
+            miner_uid = review["miner_uid"]
+            slots.append(
+                miner_uid if query_uids is None else query_uid_to_index[miner_uid]
+            )
+            scored_reviews.append((review, score))
+
+    # Reward = base * exp(-0.5 * rank) * confidence, computed in one pass
+    rewards_flat = np.zeros(0)
+    if scored_reviews:
+        rewards_flat = np.concatenate(bases)
+        rewards_flat *= _rank_decay(np.concatenate(ranks))
+        rewards_flat *= np.concatenate(confs)
+        all_rewards[np.asarray(slots, dtype=np.intp)] = rewards_flat
+
+    for (review, score), reward in zip(scored_reviews, rewards_flat.tolist()):
+        review["synapse"].review_score = score
+        review["synapse"].final_score = reward
+
+    if (m := all_rewards.max()) > 0:
+        np.divide(all_rewards, m, out=all_rewards)
 
     return all_rewards, scored_uids
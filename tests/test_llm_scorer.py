@@ -0,0 +1,162 @@
+import asyncio
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+import orjson
+import pytest
+
+from template.validator import llm_scorer
+from template.validator.llm_scorer import LLMReviewScorer, score_reviews_grouped
+
+
+class StubScorer:
+    """Stands in for LLMReviewScorer, scoring each review text from a fixed table."""
+
+    model = "stub-model"
+
+    def __init__(self, table):
+        self.table = table
+
+    async def score_reviews_for_paper(self, paper_abstract, reviews, inflight=None, use_cache=True):
+        return [dict(self.table[r["review_text"]]) for r in reviews]
+
+    def flush_cache(self):
+        pass
+
+
+class FakeOpenAI:
+    """Replaces AsyncOpenAI; counts chat completion calls and returns a fixed rubric."""
+
+    def __init__(self, api_key=None):
+        self.calls = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        await asyncio.sleep(0)
+        content = orjson.dumps({"comprehension": 3, "technical_depth": 3, "confidence": 0.8})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def make_scorer(tmp_path, **kwargs):
+    with mock.patch.object(llm_scorer, "AsyncOpenAI", FakeOpenAI):
+        return LLMReviewScorer(model=StubScorer.model, cache_dir=str(tmp_path / "cache"), **kwargs)
+
+
+def make_validator(tmp_path, table, paper_ids):
+    metadata = {pid: {"paper_id": pid, "title": pid, "abstract": f"abstract {pid}"} for pid in paper_ids}
+    (tmp_path / "paper_metadata.json").write_bytes(orjson.dumps(metadata))
+    config = SimpleNamespace(llm_model=StubScorer.model, data_path=str(tmp_path))
+    return SimpleNamespace(config=config, _llm_scorer=StubScorer(table))
+
+
+def make_response(paper_id, review_text):
+    return SimpleNamespace(paper_id=paper_id, review_text=review_text, review_score=None, final_score=None)
+
+
+def score(aggregate, confidence=1.0):
+    return {"aggregate_score": aggregate, "confidence": confidence}
+
+
+def run_grouped(validator, responses, query_uids=None):
+    return asyncio.run(score_reviews_grouped(validator, responses, query_uids))
+
+
+def test_rewards_per_uid(tmp_path):
+    table = {"a": score(80.0), "b": score(40.0, 0.5), "c": score(60.0)}
+    validator = make_validator(tmp_path, table, ["p0", "p1"])
+    responses = [make_response("p0", "a"), make_response("p0", "b"), make_response("p1", "c")]
+
+    rewards, uids = run_grouped(validator, responses)
+
+    raw = np.array([80.0, 40.0 * np.exp(-0.5) * 0.5, 60.0])
+    assert uids == [0, 1, 2]
+    np.testing.assert_allclose(rewards, raw / 80.0)
+    np.testing.assert_allclose([r.final_score for r in responses], raw)
+    assert responses[1].review_score == table["b"]
+
+
+def test_ties_rank_later_submission_first(tmp_path):
+    table = {"x": score(50.0), "y": score(50.0)}
+    validator = make_validator(tmp_path, table, ["p0"])
+    responses = [make_response("p0", "x"), make_response("p0", "y")]
+
+    rewards, _ = run_grouped(validator, responses)
+
+    # The later of two equal-score reviews takes rank 0
+    np.testing.assert_allclose(rewards, [np.exp(-0.5), 1.0])
+
+
+def test_query_uids_map_to_slots(tmp_path):
+    table = {"a": score(20.0), "b": score(40.0)}
+    validator = make_validator(tmp_path, table, ["p0", "p1"])
+    responses = [make_response("p0", "a"), make_response(None, None), make_response("p1", "b")]
+
+    rewards, uids = run_grouped(validator, responses, query_uids=[7, 3, 9])
+
+    assert uids == [7, 3, 9]
+    np.testing.assert_allclose(rewards, [0.5, 0.0, 1.0])
+
+
+def test_all_zero_rewards_are_not_normalized(tmp_path):
+    table = {"a": score(0.0, 0.0), "b": score(0.0, 0.0)}
+    validator = make_validator(tmp_path, table, ["p0"])
+    responses = [make_response("p0", "a"), make_response("p0", "b")]
+
+    rewards, _ = run_grouped(validator, responses)
+
+    assert not np.isnan(rewards).any()
+    np.testing.assert_array_equal(rewards, [0.0, 0.0])
+
+
+def test_more_reviews_than_decay_table(tmp_path):
+    n = 70
+    table = {f"r{i}": score(100.0 - 0.5 * i) for i in range(n)}
+    validator = make_validator(tmp_path, table, ["p0"])
+    responses = [make_response("p0", f"r{i}") for i in range(n)]
+
+    rewards, _ = run_grouped(validator, responses)
+
+    # Ranks past the 64-entry lookup table fall back to exp()
+    bases = 100.0 - 0.5 * np.arange(n)
+    np.testing.assert_allclose(rewards, bases * np.exp(-0.5 * np.arange(n)) / 100.0)
+
+
+def test_lru_evicts_least_recently_used(tmp_path):
+    scorer = make_scorer(tmp_path, mem_cache_size=2)
+    scorer._remember("a", score(1.0))
+    scorer._remember("b", score(2.0))
+    scorer._get_cached("a")
+    scorer._remember("c", score(3.0))
+
+    assert list(scorer._mem_cache) == ["a", "c"]
+
+
+def test_cache_hits_return_independent_copies(tmp_path):
+    scorer = make_scorer(tmp_path)
+    scorer._save_cache("k", score(42.0))
+
+    hit = scorer._get_cached("k")
+    hit["aggregate_score"] = -1.0
+
+    assert scorer._get_cached("k")["aggregate_score"] == 42.0
+
+
+def test_duplicate_reviews_share_one_llm_call(tmp_path):
+    scorer = make_scorer(tmp_path)
+    validator = make_validator(tmp_path, {}, ["p0", "p1"])
+    validator._llm_scorer = scorer
+    responses = [
+        make_response("p0", "same text"),
+        make_response("p0", "same text"),
+        make_response("p0", "other text"),
+        make_response("p1", "same text"),
+    ]
+
+    run_grouped(validator, responses)
+
+    # One call per distinct (abstract, review_text) pair; p1 has a different abstract
+    assert len(scorer.client.calls) == 3
+    assert responses[0].review_score == responses[1].review_score
+    assert responses[0].review_score is not responses[1].review_score